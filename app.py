@@ -6,26 +6,29 @@ Main application file that sets up the Dash app and its core components.
 # Standard library imports
 import os
 import logging
-from typing import Optional
 
 # Third-party imports
 from dotenv import load_dotenv
 import dash
+import flask
 import dash_bootstrap_components as dbc
-from dash import html, dcc, callback, Input, Output
+from dash import html, dcc
 
 # Local imports
 from components import create_processing_alert
+from extensions import cache, grid_cache
+
+# Load environment variables first so LOG_LEVEL can come from .env
+load_dotenv()
 
 # Configure logging
 logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
+    level=os.environ.get("LOG_LEVEL", "INFO").upper(),
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    force=True
 )
 logger = logging.getLogger(__name__)
 
-# Load environment variables
-load_dotenv()
 logger.info("Environment variables loaded")
 
 def create_navbar() -> dbc.NavbarSimple:
@@ -43,18 +46,50 @@ def create_navbar() -> dbc.NavbarSimple:
         className="mb-4"
     )
 
+def create_welcome_alert() -> dbc.Alert:
+    """
+    Create the welcome message shown when the app first loads.
+    
+    The alert is static, so it is part of the layout rather than the output
+    of a server callback.
+    
+    Returns:
+        dbc.Alert: The welcome message alert component
+    """
+    return dbc.Alert(
+        [
+            html.I(className="fas fa-info-circle me-2"),
+            html.Strong("Welcome to Seeklyzer! "), 
+            "Navigate using the menu above to access different features."
+        ],
+        className="text-center",
+        color="info",
+        dismissable=True,
+        is_open=True,
+        duration=8000
+    )
+
 def create_app_layout() -> html.Div:
     """Create the main application layout."""
     return html.Div([
         create_navbar(),
-        html.Div(id="global-alert-container", className="mb-3"),
-        dash.page_container,
-        html.Div(id='_', style={'display': 'none'})
+        html.Div(create_welcome_alert(), id="global-alert-container", className="mb-3"),
+        dash.page_container
     ])
 
+# Grid rows and resume text are large, highly compressible JSON. Dash's compress=True
+# sets up Flask-Compress, which reads these settings when the app is created.
+flask_server = flask.Flask(__name__)
+flask_server.config.update(
+    COMPRESS_MIMETYPES=['application/json', 'text/html', 'text/css', 'application/javascript'],
+    COMPRESS_ALGORITHM=['br', 'gzip']
+)
+
 # Initialize the Dash app
 app = dash.Dash(
     __name__,
+    server=flask_server,
+    compress=True,
     external_stylesheets=[
         dbc.themes.BOOTSTRAP,
         "https://use.fontawesome.com/releases/v5.15.4/css/all.css"
@@ -63,45 +98,39 @@ app = dash.Dash(
     use_pages=True
 )
 
+cache.init_app(app.server, config={
+    'CACHE_TYPE': 'FileSystemCache',
+    'CACHE_DIR': '.cache',
+    'CACHE_DEFAULT_TIMEOUT': 3600
+})
+
+# One entry per search; the threshold leaves room for a day of searches before pruning
+grid_cache.init_app(app.server, config={
+    'CACHE_TYPE': 'FileSystemCache',
+    'CACHE_DIR': '.grid_cache',
+    'CACHE_DEFAULT_TIMEOUT': 86400,
+    'CACHE_THRESHOLD': 20000
+})
+
+# WSGI entry point for production servers, e.g. `gunicorn app:server`
+server = app.server
+
 app.title = "Seeklyzer - Find Roles That Truly Fit"
 app.layout = create_app_layout()
 logger.info("Dash app initialized with Bootstrap theme and multi-page support")
 
-@callback(
-    Output('global-alert-container', 'children'),
-    Input('_', 'children'),
-)
-def show_welcome_message(_) -> Optional[dbc.Alert]:
-    """
-    Display a welcome message when the app first loads.
-    
-    Args:
-        _: Unused input trigger
-        
-    Returns:
-        Optional[dbc.Alert]: The welcome message alert component
-    """
-    return dbc.Alert(
-        [
-            html.I(className="fas fa-info-circle me-2"),
-            html.Strong("Welcome to Seeklyzer! "), 
-            "Navigate using the menu above to access different features."
-        ],
-        className="text-center",
-        color="info",
-        dismissable=True,
-        is_open=True,
-        duration=8000
-    )
-
 def main() -> None:
     """Main entry point for the application."""
     try:
+        host = os.environ.get("HOST", "127.0.0.1")
+        port = int(os.environ.get("PORT", "8050"))
         logger.info("Starting Seeklyzer Dash App...")
-        logger.info("Server running at http://127.0.0.1:8050/scripts")
+        logger.info("Server running at http://%s:%s/scripts", host, port)
         app.run(
-            debug=False,
-            port=8050
+            debug=os.environ.get("DASH_DEBUG", "0") == "1",
+            threaded=True,
+            host=host,
+            port=port
         )
     except Exception as e:
         logger.error(f"Critical error: {str(e)}", exc_info=True)
@@ -0,0 +1,123 @@
+var dashclientside = window.dash_clientside = window.dash_clientside || {};
+
+// Upload-area styles are shared, read-only objects rather than rebuilt per call
+var UPLOAD_STYLE_DEFAULT = Object.freeze({
+    width: '100%',
+    height: '60px',
+    lineHeight: '60px',
+    borderWidth: '1px',
+    borderStyle: 'dashed',
+    borderRadius: '5px',
+    textAlign: 'center',
+    margin: '10px'
+});
+
+var UPLOAD_STYLE_VALID = Object.freeze({
+    width: '100%',
+    height: '60px',
+    lineHeight: '60px',
+    borderWidth: '2px',
+    borderStyle: 'solid',
+    borderColor: 'green',
+    borderRadius: '5px',
+    textAlign: 'center',
+    margin: '10px',
+    backgroundColor: '#f0fff0'
+});
+
+var UPLOAD_STYLE_INVALID = Object.freeze({
+    width: '100%',
+    height: '60px',
+    lineHeight: '60px',
+    borderWidth: '2px',
+    borderStyle: 'solid',
+    borderColor: '#ff7b00',
+    borderRadius: '5px',
+    textAlign: 'center',
+    margin: '10px',
+    backgroundColor: '#fff9f0'
+});
+
+dashclientside.resume = {
+    update_upload_area: function (contents, filename) {
+        if (contents === null || contents === undefined) {
+            return [
+                ['Drag and Drop or ', {
+                    namespace: 'dash_html_components',
+                    type: 'A',
+                    props: { children: 'Select a PDF File' }
+                }],
+                UPLOAD_STYLE_DEFAULT,
+                null
+            ];
+        }
+
+        if (filename.toLowerCase().endsWith('.pdf')) {
+            return [
+                [{
+                    namespace: 'dash_html_components',
+                    type: 'I',
+                    props: { className: 'fas fa-file-pdf me-2' }
+                }, 'Selected: ' + filename],
+                UPLOAD_STYLE_VALID,
+                {
+                    namespace: 'dash_bootstrap_components',
+                    type: 'Alert',
+                    props: {
+                        children: "PDF file '" + filename + "' selected successfully. Click 'Parse Resume' to extract text.",
+                        className: 'text-center',
+                        color: 'success',
+                        dismissable: true,
+                        is_open: true,
+                        duration: 4000
+                    }
+                }
+            ];
+        }
+
+        return [
+            [{
+                namespace: 'dash_html_components',
+                type: 'I',
+                props: { className: 'fas fa-exclamation-triangle me-2' }
+            }, 'Selected: ' + filename + ' (Not a PDF file)'],
+            UPLOAD_STYLE_INVALID,
+            {
+                namespace: 'dash_bootstrap_components',
+                type: 'Alert',
+                props: {
+                    children: "Warning: '" + filename + "' is not a PDF file. Only PDF files are supported.",
+                    className: 'text-center',
+                    color: 'warning',
+                    dismissable: true,
+                    is_open: true,
+                    duration: 6000
+                }
+            }
+        ];
+    }
+};
+
+dashclientside.jobs = {
+    toggle_collapse: function (n_clicks, is_open) {
+        return n_clicks ? !is_open : is_open;
+    },
+
+    toggle_assess_button: function (resume_data) {
+        return !resume_data;
+    },
+
+    expand_grid_rows: function (rows) {
+        if (!rows) {
+            return [];
+        }
+        var columns = rows.columns;
+        return rows.data.map(function (values) {
+            var record = {};
+            for (var i = 0; i < columns.length; i++) {
+                record[columns[i]] = values[i];
+            }
+            return record;
+        });
+    }
+};
@@ -0,0 +1,41 @@
+"""
+Shared server-side extensions for the Seeklyzer application.
+Objects here are created unbound and attached to the Flask server in app.py,
+so pages can import them without importing app.
+"""
+
+import os
+from functools import lru_cache
+from typing import Optional
+
+from flask_caching import Cache
+from langchain_xai import ChatXAI
+
+cache = Cache()
+# Search results live in their own cache so memoized model calls can't prune them
+grid_cache = Cache()
+
+@lru_cache(maxsize=8)
+def get_chat_xai(model: str, temperature: float, max_tokens: int,
+                 timeout: Optional[float] = None, max_retries: int = 2) -> ChatXAI:
+    """
+    Returns a shared ChatXAI client so its HTTP connection pool is reused across requests.
+    
+    Args:
+        model (str): The xAI model name
+        temperature (float): Sampling temperature
+        max_tokens (int): Maximum tokens in the response
+        timeout (float, optional): Seconds to wait for each request; None waits indefinitely
+        max_retries (int): Retries after a failed or timed out request
+        
+    Returns:
+        ChatXAI: A client created on first use for this configuration
+    """
+    return ChatXAI(
+        api_key=os.environ["XAI_API_KEY"],
+        model=model,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        timeout=timeout,
+        max_retries=max_retries
+    )
@@ -1,13 +1,20 @@
 import re
+import threading
 import time
-from typing import Dict, List, Optional, Any
+from functools import lru_cache, partial
+from hashlib import blake2b
+from typing import Dict, List, Optional, Tuple, Any
 import dash
-from dash import html, dcc, Input, Output, State, callback, MATCH
+from dash import html, dcc, Input, Output, State, callback, clientside_callback, ClientsideFunction, MATCH
 import dash_bootstrap_components as dbc
-from langchain_xai import ChatXAI
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 from dash_ag_grid import AgGrid
 import json
+import orjson
 import os
 from datetime import datetime, timedelta
 import base64
@@ -16,6 +23,8 @@ import io
 from langchain_openai import OpenAIEmbeddings
 from langchain_chroma import Chroma
 
+from extensions import cache, get_chat_xai, grid_cache
+
 
 
 # Register the page
@@ -26,18 +35,70 @@ dash.register_page(
     name='Job Finder'
 )
 
+JOBS_PARQUET_PATH = "data/preprocessed_seek_jobs_files/preprocessed_seek_jobs_plus_json.parquet"
+
+# Only the columns shown in the grid, the details modal and the assessments are kept in memory
+JOB_COLUMNS = [
+    'Job Id', 'Job Title', 'Work Arrangement', 'Work Type', 'Posting Date',
+    'Salary Range', 'Advertiser Name', 'Location', 'Extracted Details'
+]
+
+# Long text only shown in the details modal, read for one job at a time when it is opened
+DETAIL_COLUMNS = [
+    'Job Teaser', 'Highlights', 'Highlight Point 1', 'Highlight Point 2',
+    'Highlight Point 3', 'Job Description'
+]
+
+# Columns sent to the grid
+GRID_COLUMNS = [
+    'Job Id', 'Job Title', 'Work Arrangement', 
+    'Work Type', 'Posting Date', 'Advertiser Name', 'Location'
+]
+
+# Low-cardinality text columns stored as categories to save memory
+CATEGORICAL_COLUMNS = ['Work Type', 'Work Arrangement', 'Location', 'Advertiser Name', 'Salary Range']
+
+# Text columns matched by the search filters
+SEARCH_COLUMNS = ['Job Title', 'Advertiser Name', 'Location']
+
+def _jobs_file_mtime_ns() -> Optional[int]:
+    try:
+        return os.stat(JOBS_PARQUET_PATH).st_mtime_ns
+    except OSError:
+        return None
+
+@lru_cache(maxsize=1)
+def _read_jobs_metadata(mtime_ns: Optional[int]) -> pq.FileMetaData:
+    # mtime_ns is only part of the cache key, so the footer is parsed once per file version
+    return pq.read_metadata(JOBS_PARQUET_PATH)
+
 def load_job_data() -> pd.DataFrame:
     print("\n=== Loading Job Data ===")
     try:
-        df = pd.read_parquet("data/preprocessed_seek_jobs_files/preprocessed_seek_jobs_plus_json.parquet")
-        # Convert JSON columns to strings for display
+        available_columns = set(_read_jobs_metadata(_jobs_file_mtime_ns()).schema.to_arrow_schema().names)
+        # Row groups decompress in parallel; pre_buffer coalesces the column chunk reads
+        table = pq.read_table(
+            JOBS_PARQUET_PATH,
+            columns=[col for col in JOB_COLUMNS if col in available_columns],
+            use_threads=True,
+            pre_buffer=True
+        )
+        # One block per column, freeing each Arrow buffer as soon as it is converted
+        df = table.to_pandas(split_blocks=True, self_destruct=True)
+        del table
+        for col in CATEGORICAL_COLUMNS:
+            if col in df.columns:
+                df[col] = df[col].astype('category')
+        # Parse JSON object strings back into dicts
         for col in df.columns:
             if df[col].dtype == 'object':
                 try:
-                    # Try to parse if it's already a string representation of JSON
-                    df[col] = df[col].apply(lambda x: json.loads(x) if isinstance(x, str) and x.strip().startswith('{') else x)
+                    # Vectorized probe so only cells holding a JSON object are parsed
+                    is_json = df[col].str.lstrip().str.startswith('{', na=False)
+                    if is_json.any():
+                        df.loc[is_json, col] = df.loc[is_json, col].map(orjson.loads)
                 except:
-                    # If parsing fails, keep as is
+                    # Non-string columns or invalid JSON are kept as is
                     pass
         # print("Available columns:", df.columns.tolist())
         return df
@@ -45,12 +106,206 @@ def load_job_data() -> pd.DataFrame:
         print(f"Error loading data: {e}")
         return pd.DataFrame()
 
+def prepare_search_values(series: pd.Series) -> Tuple[pa.Array, Optional[np.ndarray]]:
+    """
+    Lowercases a text column into an Arrow array once, so it can be searched many times.
+    
+    Args:
+        series: Text column to search, plain or categorical
+        
+    Returns:
+        The lowercased values and, for categorical columns, the codes mapping each row to
+        its category (the values are then the categories)
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # Only the distinct values are searched, then broadcast through the category codes
+        values = pa.array(series.cat.categories.astype(str), type=pa.string())
+        codes = series.cat.codes.to_numpy()
+    else:
+        values = pa.array(series, type=pa.string(), from_pandas=True)
+        codes = None
+    return pc.utf8_lower(values), codes
+
+def contains_any(prepared: Tuple[pa.Array, Optional[np.ndarray]], terms: List[str]) -> np.ndarray:
+    """
+    Case-insensitive literal substring match of any of the terms, using Arrow compute kernels.
+    
+    Args:
+        prepared: Column values from prepare_search_values
+        terms: Substrings to look for
+        
+    Returns:
+        Boolean mask over the rows; missing values never match
+    """
+    values, codes = prepared
+    if len(terms) == 1:
+        mask = pc.match_substring(values, terms[0].lower())
+    else:
+        # One pass with an escaped alternation (compiled to a DFA by RE2) instead of a pass per term
+        pattern = '|'.join(re.escape(term.lower()) for term in terms)
+        mask = pc.match_substring_regex(values, pattern)
+    matched = pc.fill_null(mask, False).to_numpy(zero_copy_only=False)
+    
+    if codes is not None:
+        # Code -1 marks a missing value and picks the appended False
+        matched = np.append(matched, False)[codes]
+    return matched
+
+def parse_posting_dates(series: pd.Series) -> pd.Series:
+    """
+    Parses posting dates to UTC timestamps; unparseable dates become NaT.
+    
+    Args:
+        series: The Posting Date column
+        
+    Returns:
+        The dates as timezone-aware UTC timestamps
+    """
+    # Date-typed columns need no parsing
+    if not pd.api.types.is_datetime64_any_dtype(series):
+        # utc=True also handles strings with mixed offsets, which would otherwise
+        # parse to an object column without the .dt accessor; naive dates are taken as UTC
+        return pd.to_datetime(series, errors='coerce', utc=True)
+    
+    # If the dates are already timezone-aware, convert them to UTC
+    if series.dt.tz is not None:
+        return series.dt.tz_convert('UTC')
+    return series.dt.tz_localize('UTC')
+
+# The job data is read once per version of the parquet file and shared by all callbacks.
+# The unfiltered grid rows are serialized once alongside it, the search columns are
+# lowercased into Arrow arrays and the posting dates parsed once rather than on every query.
+_JOBS_DF = pd.DataFrame()
+_JOBS_BY_ID = _JOBS_DF
+_SEARCH_INDEX = (_JOBS_DF, {}, None)
+# (mtime_ns, parquet footer, Job Id -> row group) of the loaded file version, swapped as one
+_JOB_FILE_INDEX = (None, None, {})
+_GRID_ROWS = {"columns": GRID_COLUMNS, "data": []}
+_JOBS_MTIME_NS = None
+_JOBS_LOCK = threading.Lock()
+
+# Reads attempted when the parquet file keeps changing while it is being loaded
+_RELOAD_ATTEMPTS = 3
+
+def _index_row_groups(df: pd.DataFrame, metadata: pq.FileMetaData) -> Dict[Any, int]:
+    """Maps each Job Id to the parquet row group holding it, so one job can be read alone."""
+    row_counts = [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)]
+    if sum(row_counts) != len(df):
+        # The file changed since it was loaded; details fall back to a filtered read
+        return {}
+    # Rows keep their file order, so a row's group follows from the cumulative row counts
+    row_groups = np.searchsorted(np.cumsum(row_counts), np.arange(len(df)), side='right')
+    first = ~df['Job Id'].duplicated().to_numpy()
+    return dict(zip(df['Job Id'][first].tolist(), row_groups[first].tolist()))
+
+def reload_job_data() -> pd.DataFrame:
+    global _JOBS_DF, _JOBS_BY_ID, _GRID_ROWS, _SEARCH_INDEX, _JOB_FILE_INDEX, _JOBS_MTIME_NS
+    with _JOBS_LOCK:
+        for _ in range(_RELOAD_ATTEMPTS):
+            mtime_ns = _jobs_file_mtime_ns()
+            if mtime_ns == _JOBS_MTIME_NS:
+                # Another request loaded this version while this one waited for the lock
+                return _JOBS_DF
+            df = load_job_data()
+            if _jobs_file_mtime_ns() == mtime_ns:
+                break
+            # The file was rewritten during the load, so the frame may not match mtime_ns
+        _JOBS_BY_ID = df.drop_duplicates("Job Id").set_index("Job Id", drop=False) if not df.empty else df
+        _GRID_ROWS = df[GRID_COLUMNS].to_dict("split", index=False) if not df.empty else {"columns": GRID_COLUMNS, "data": []}
+        try:
+            posting_dates = parse_posting_dates(df['Posting Date']) if 'Posting Date' in df.columns else None
+        except (ValueError, TypeError, AttributeError):
+            # Left to the date filter, which reports the problem per query
+            posting_dates = None
+        # Stored as one tuple so a search never pairs a frame with another version's arrays
+        _SEARCH_INDEX = (
+            df,
+            {col: prepare_search_values(df[col]) for col in SEARCH_COLUMNS if col in df.columns},
+            posting_dates
+        )
+        try:
+            metadata = _read_jobs_metadata(mtime_ns)
+        except Exception as e:
+            print(f"Error reading parquet metadata: {e}")
+            metadata = None
+        row_groups = _index_row_groups(df, metadata) if metadata is not None and not df.empty else {}
+        _JOB_FILE_INDEX = (mtime_ns, metadata, row_groups)
+        _JOBS_DF = df
+        _JOBS_MTIME_NS = mtime_ns
+        return df
+
+def get_job_data() -> pd.DataFrame:
+    # A single stat per call; the parquet is only re-read after the pipeline rewrites it
+    if _jobs_file_mtime_ns() != _JOBS_MTIME_NS:
+        return reload_job_data()
+    return _JOBS_DF
+
+def get_job_row(job_id) -> pd.Series:
+    get_job_data()
+    return _JOBS_BY_ID.loc[job_id]
+
+@lru_cache(maxsize=64)
+def _read_job_details(job_id, mtime_ns: Optional[int], metadata: Optional[pq.FileMetaData],
+                      row_group: Optional[int]) -> dict:
+    # mtime_ns, metadata and row_group come from one _JOB_FILE_INDEX snapshot, so a
+    # rewritten file is read afresh. Errors are left to the callers; caching them
+    # would hide the details until restart.
+    if _jobs_file_mtime_ns() != mtime_ns:
+        # The file changed after the snapshot, so its footer and row groups no longer apply
+        metadata, row_group = None, None
+
+    # The cached footer skips re-parsing the metadata; pre_buffer coalesces the
+    # detail column chunks of the row group into fewer reads
+    with pq.ParquetFile(JOBS_PARQUET_PATH, metadata=metadata, pre_buffer=True) as parquet_file:
+        columns = [col for col in DETAIL_COLUMNS if col in parquet_file.schema_arrow.names]
+        if row_group is not None:
+            # Only the job's own row group is decoded
+            table = parquet_file.read_row_group(row_group, columns=columns + ['Job Id'])
+            table = table.filter(pc.equal(table['Job Id'], job_id)).select(columns)
+        else:
+            table = pq.read_table(
+                JOBS_PARQUET_PATH,
+                columns=columns,
+                filters=[('Job Id', '=', job_id)]
+            )
+    rows = table.to_pylist()
+    return rows[0] if rows else {}
+
+def get_job_details(job_id) -> dict:
+    """
+    Reads the modal-only columns of a single job from the parquet file.
+    
+    Args:
+        job_id: Id of the job to read
+        
+    Returns:
+        The job's DETAIL_COLUMNS values, or an empty dict if it can't be read
+    """
+    try:
+        return _load_job_details(job_id)
+    except Exception as e:
+        print(f"Error loading job details: {e}")
+        return {}
+
+def _load_job_details(job_id) -> dict:
+    """Reads a job's DETAIL_COLUMNS from the loaded file version; errors are raised."""
+    get_job_data()
+    mtime_ns, metadata, row_groups = _JOB_FILE_INDEX
+    return _read_job_details(job_id, mtime_ns, metadata, row_groups.get(job_id))
+
+reload_job_data()
+
 #############################################
 
 from langchain_openai import OpenAI
 
+@lru_cache(maxsize=1)
+def get_filter_llm() -> OpenAI:
+    return OpenAI(temperature=0, openai_api_key=os.environ.get('OPENAI_API_KEY'))
 
-# Extraction function using a single text template
+# Extraction function using a single text template.
+# Results are cached per query, so repeating a search skips the LLM call.
+@cache.memoize(timeout=86400, hash_method=partial(blake2b, digest_size=16))
 def extract_filters(user_query: str) -> dict:
     print("\n=== Extracting Filters ===")
     base_prompt = """
@@ -111,7 +366,7 @@ def extract_filters(user_query: str) -> dict:
     "{user_query}"
     """
 
-    llm = OpenAI(temperature=0, openai_api_key=os.environ.get('OPENAI_API_KEY'))
+    llm = get_filter_llm()
     prompt = base_prompt.format(user_query=user_query)
     raw_output = llm.invoke(prompt)
     raw_output = raw_output.replace("Returned JSON:", "").strip()
@@ -124,187 +379,239 @@ def extract_filters(user_query: str) -> dict:
 #############################################
 
 
-def get_column_definitions() -> List[Dict[str, Any]]:    
-    print("\n=== Getting Column Definitions ===")
-    return [
-        {
-            "field": "Job Id",
-            "filter": True,
-            "sortable": True,
-            "width": 100,
-            "minWidth": 80,
-            "flex": 0
-        },
-        {
-            "field": "Job Title",
-            "filter": True,
-            "sortable": True,
-            "width": 270,
-            "minWidth": 200,
-            "flex": 2
-        },
-        {
-            "field": "Advertiser Name",
-            "headerName": "Company Name",
-            "filter": True,
-            "sortable": True,
-            "width": 200,
-            "minWidth": 150,
-            "flex": 1
-        },
-        {
-            "field": "Location",
-            "filter": True,
-            "sortable": True,
-            "width": 150,
-            "minWidth": 120,
-            "flex": 1
-        },
-        {
-            "field": "Work Type",
-            "filter": True,
-            "sortable": True,
-            "width": 150,
-            "minWidth": 150,
-            "flex": 0
-        },
-        {
-            "field": "Work Arrangement",
-            "filter": True,
-            "sortable": True,
-            "width": 180,
-            "minWidth": 180,
-            "flex": 0
-        },
-        {
-            "field": "Posting Date",
-            "filter": True,
-            "sortable": True,
-            "width": 200,
-            "minWidth": 200,
-            "flex": 1
-        },
-        {
-            "field": "actions",
-            "headerName": "Actions",
-            "sortable": False,
-            "filter": False,
-            "cellRenderer": "ActionButtons",
-            "width": 200,
-            "minWidth": 200,
-            "flex": 1
-        }
-    ]
+# Column definitions are static, so they are built once at import
+COLUMN_DEFS = [
+    {
+        "field": "Job Id",
+        "filter": True,
+        "sortable": True,
+        "width": 100,
+        "minWidth": 80,
+        "flex": 0
+    },
+    {
+        "field": "Job Title",
+        "filter": True,
+        "sortable": True,
+        "width": 270,
+        "minWidth": 200,
+        "flex": 2
+    },
+    {
+        "field": "Advertiser Name",
+        "headerName": "Company Name",
+        "filter": True,
+        "sortable": True,
+        "width": 200,
+        "minWidth": 150,
+        "flex": 1
+    },
+    {
+        "field": "Location",
+        "filter": True,
+        "sortable": True,
+        "width": 150,
+        "minWidth": 120,
+        "flex": 1
+    },
+    {
+        "field": "Work Type",
+        "filter": True,
+        "sortable": True,
+        "width": 150,
+        "minWidth": 150,
+        "flex": 0
+    },
+    {
+        "field": "Work Arrangement",
+        "filter": True,
+        "sortable": True,
+        "width": 180,
+        "minWidth": 180,
+        "flex": 0
+    },
+    {
+        "field": "Posting Date",
+        "filter": True,
+        "sortable": True,
+        "width": 200,
+        "minWidth": 200,
+        "flex": 1
+    },
+    {
+        "field": "actions",
+        "headerName": "Actions",
+        "sortable": False,
+        "filter": False,
+        "cellRenderer": "ActionButtons",
+        "width": 200,
+        "minWidth": 200,
+        "flex": 1
+    }
+]
 
-def create_job_grid(df: pd.DataFrame = None) -> AgGrid:
-    print("\n=== Creating Job Grid ===")
+# Queries shorter than this match almost everything and are not sent to the models
+MIN_SEARCH_CHARS = 3
+
+# How long a search result shown in the grid can still be resolved from its key
+GRID_RESULT_TIMEOUT = 86400
+SEARCH_EXPIRED_MESSAGE = "These search results have expired. Please search again."
+
+def store_grid_result(df: Optional[pd.DataFrame]) -> dict:
+    """
+    Keeps the Job Ids of a search result server-side, so callbacks that act on the grid's
+    jobs receive a small key from the browser instead of every row.
+    
+    Args:
+        df: The rows shown in the grid, or None for the full job data
+        
+    Returns:
+        Data for the job-grid-result store
+    """
+    if df is None:
+        return {"key": None, "rows": len(get_job_data())}
+    job_ids = df['Job Id'].tolist()
+    key = blake2b(orjson.dumps(job_ids), digest_size=16).hexdigest()
+    grid_cache.set(f"job-grid:{key}", job_ids, timeout=GRID_RESULT_TIMEOUT)
+    return {"key": key, "rows": len(job_ids)}
+
+def get_grid_job_ids(grid_result: Optional[dict]) -> Optional[List]:
+    """
+    Returns the Job Ids shown in the grid, as recorded by store_grid_result.
+    
+    Args:
+        grid_result: Data of the job-grid-result store
+        
+    Returns:
+        The Job Ids, or None if the search result has expired from the cache
+    """
+    if not grid_result or grid_result.get("key") is None:
+        return get_job_data()['Job Id'].tolist()
+    job_ids = grid_cache.get(f"job-grid:{grid_result['key']}")
+    if job_ids is None:
+        print("Search result expired")
+    return job_ids
+
+def get_grid_data(df: pd.DataFrame = None) -> Tuple[dict, dict]:
+    """
+    Serializes rows for the job grid, which is built once in the layout and only
+    receives new data afterwards.
+    
+    Args:
+        df: The rows to show, or None for all jobs
+        
+    Returns:
+        Data for the job-grid-rows and job-grid-result stores
+    """
+    print("\n=== Preparing Grid Data ===")
+    grid_result = store_grid_result(df)
     if df is None:
         print("Loading default data")
-        df = load_job_data()
-    if df.empty:
-        print("No data available")
-        return dbc.Alert("No data available", color="warning")
-    
-    print(f"Creating grid with {len(df)} rows")
-    # Filter for specific columns
-    columns_to_show = [
-        'Job Id', 'Job Title', 'Work Arrangement', 
-        'Work Type', 'Posting Date', 'Advertiser Name', 'Location'
-    ]
-    df = df[columns_to_show]
-    
-    
-    print("Grid created successfully")
-    
-    return AgGrid(
-        id="job-grid",
-        rowData=df.to_dict("records"),
-        columnDefs=get_column_definitions(),
-        defaultColDef={
-            "resizable": True,
-            "sortable": True,
-            "filter": True,
-            "minWidth": 100,
-            "flex": 1,
-        },
-        dashGridOptions={
-            "rowHeight": 48,
-            "headerHeight": 48,
-            "pagination": True,
-            "paginationPageSize": 20,
-            "domLayout": "autoHeight",
-            "animateRows": True,
-            "rowSelection": "single",
-            "enableCellTextSelection": True,
-            "ensureDomOrder": True,
-            "suppressCellFocus": False,
-            "headerClass": "ag-header-cell-custom",
-            "rowClass": "ag-row-custom"
-        },
-        style={
-            "height": "700px",
-            "width": "100%",
-            "fontFamily": "Arial, sans-serif",
-            "fontSize": "14px"
-        },
-        className="ag-theme-alpine"
-    )
+        return _GRID_ROWS, grid_result
+    
+    print(f"Sending {len(df)} rows to the grid")
+    return df[GRID_COLUMNS].to_dict("split", index=False), grid_result
+
+def create_job_grid() -> html.Div:
+    print("\n=== Creating Job Grid ===")
+    grid_rows, grid_result = get_grid_data()
+    
+    # Rows travel in split orient (column names sent once) and are expanded in the browser
+    return html.Div([
+        dcc.Store(id="job-grid-rows", data=grid_rows),
+        dcc.Store(id="job-grid-result", data=grid_result),
+        AgGrid(
+            id="job-grid",
+            rowData=[],
+            columnDefs=COLUMN_DEFS,
+            defaultColDef={
+                "resizable": True,
+                "sortable": True,
+                "filter": True,
+                "minWidth": 100,
+                "flex": 1,
+            },
+            dashGridOptions={
+                "rowHeight": 48,
+                "headerHeight": 48,
+                "pagination": True,
+                "paginationPageSize": 20,
+                "domLayout": "autoHeight",
+                "animateRows": True,
+                "rowSelection": "single",
+                "enableCellTextSelection": True,
+                "ensureDomOrder": True,
+                "suppressCellFocus": False,
+                "headerClass": "ag-header-cell-custom",
+                "rowClass": "ag-row-custom",
+                "overlayNoRowsTemplate": "No data available"
+            },
+            style={
+                "height": "700px",
+                "width": "100%",
+                "fontFamily": "Arial, sans-serif",
+                "fontSize": "14px"
+            },
+            className="ag-theme-alpine"
+        )
+    ])
 
 def filter_dataframe(df: pd.DataFrame, filters: dict) -> pd.DataFrame:
     print("\n=== Filtering DataFrame ===")
     if not filters:
         return df
     
-    filtered_df = df.copy()
+    # The cached job data comes with its search columns and dates already prepared
+    indexed_df, prepared, posting_dates = _SEARCH_INDEX
+    if df is not indexed_df:
+        prepared, posting_dates = {}, None
+    
+    def search_values(column: str) -> Tuple[pa.Array, Optional[np.ndarray]]:
+        return prepared.get(column) or prepare_search_values(df[column])
+    
+    # Filters are combined into one mask and applied once at the end
+    mask = np.ones(len(df), dtype=bool)
     
     # Apply each filter if it exists
     if filters.get('job_title'):
-        # Split job titles by comma and create a pattern that matches any of them
-        job_titles = [title.strip() for title in filters['job_title'].split(',')]
-        # Create a pattern that matches any of the job titles
-        pattern = '|'.join(job_titles)
-        filtered_df = filtered_df[filtered_df['Job Title'].str.contains(pattern, case=False, na=False)]
+        # Split job titles by comma and match any of them
+        job_titles = [title.strip() for title in filters['job_title'].split(',') if title.strip()]
+        if job_titles:
+            mask &= contains_any(search_values('Job Title'), job_titles)
     
     if filters.get('work_arrangement'):
         arrangements = [arr.strip() for arr in filters['work_arrangement'].split(',')]
-        filtered_df = filtered_df[filtered_df['Work Arrangement'].isin(arrangements)]
+        mask &= df['Work Arrangement'].isin(arrangements).to_numpy()
     
     if filters.get('work_type'):
         work_types = [wt.strip() for wt in filters['work_type'].split(',')]
-        filtered_df = filtered_df[filtered_df['Work Type'].isin(work_types)]
+        mask &= df['Work Type'].isin(work_types).to_numpy()
     
     if filters.get('company_name'):
-        filtered_df = filtered_df[filtered_df['Advertiser Name'].str.contains(filters['company_name'], case=False, na=False)]
+        mask &= contains_any(search_values('Advertiser Name'), [filters['company_name']])
     
     if filters.get('location'):
-        # Split locations by comma and create a pattern that matches any of them
-        locations = [loc.strip() for loc in filters['location'].split(',')]
-        # Create a pattern that matches any of the locations
-        pattern = '|'.join(locations)
-        filtered_df = filtered_df[filtered_df['Location'].str.contains(pattern, case=False, na=False)]
+        # Split locations by comma and match any of them
+        locations = [loc.strip() for loc in filters['location'].split(',') if loc.strip()]
+        if locations:
+            mask &= contains_any(search_values('Location'), locations)
     
     if filters.get('posting_date'):
         try:
             days_ago = int(filters['posting_date'])
-            # Convert Posting Date column to datetime
-            filtered_df['Posting Date'] = pd.to_datetime(filtered_df['Posting Date'])
-            
-            # If the dates are already timezone-aware, convert them to UTC
-            if filtered_df['Posting Date'].dt.tz is not None:
-                filtered_df['Posting Date'] = filtered_df['Posting Date'].dt.tz_convert('UTC')
-            else:
-                filtered_df['Posting Date'] = filtered_df['Posting Date'].dt.tz_localize('UTC')
+            if posting_dates is None:
+                posting_dates = parse_posting_dates(df['Posting Date'])
             
             # Calculate the cutoff date (days_ago days from now) in UTC
             cutoff_date = pd.Timestamp.now(tz='UTC') - pd.Timedelta(days=days_ago)
             
             # Filter for jobs posted within the last X days
-            filtered_df = filtered_df[filtered_df['Posting Date'] >= cutoff_date]
+            mask &= (posting_dates >= cutoff_date).to_numpy()
             
-        except ValueError:
-            print(f"Invalid posting_date value: {filters['posting_date']}")
+        except (ValueError, TypeError, AttributeError) as e:
+            print(f"Could not filter by posting_date {filters['posting_date']}: {e}")
     
-    return filtered_df
+    return df[mask]
 
 def create_job_details_modal() -> dbc.Modal:
     print("\n=== Creating Job Details Modal ===")
@@ -368,6 +675,11 @@ def create_assessment_modal() -> dbc.Modal:
 
 from bs4 import BeautifulSoup
 
+HEADING_TAGS = ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']
+_HEADING_PATTERN = re.compile(r'<h[1-6][\s>/]', re.IGNORECASE)
+
+# Reopening a job's details reuses the converted description instead of parsing it again
+@lru_cache(maxsize=64)
 def replace_heading_with_strong(html_text):
     print("\n=== Replacing Headings with Strong Tags ===")
     """
@@ -377,20 +689,40 @@ def replace_heading_with_strong(html_text):
     :param html_text: HTML string containing heading tags
     :return: Modified HTML string with headings replaced by <strong>
     """
+    if not _HEADING_PATTERN.search(html_text):
+        # No headings, so there is nothing to parse
+        return html_text
     soup = BeautifulSoup(html_text, 'html.parser')
-    for level in range(1, 7):
-        for tag in soup.find_all(f'h{level}'):
-            strong_tag = soup.new_tag('strong')
-            strong_tag.string = tag.get_text()
-            tag.replace_with(strong_tag)
+    for tag in soup.find_all(HEADING_TAGS):
+        strong_tag = soup.new_tag('strong')
+        strong_tag.string = tag.get_text()
+        tag.replace_with(strong_tag)
     return str(soup)
 
+# Reopening a job reuses its row, details and converted description; mtime_ns is only
+# part of the cache key, so a rewritten parquet file is read afresh. Only plain data is
+# cached, since callbacks may edit the components built from it.
+@lru_cache(maxsize=256)
+def _job_details_data(job_id, mtime_ns: Optional[int], with_details: bool) -> Dict[str, Any]:
+    row = get_job_row(job_id)
+    # Categorical columns hold NaN for missing values, which would render as 'nan'
+    job_data = row.astype(object).where(row.notna(), None).to_dict()
+    if with_details:
+        job_data.update(_load_job_details(job_id))
+    if job_data.get("Job Description"):
+        job_data["Job Description"] = replace_heading_with_strong(job_data["Job Description"])
+    return job_data
+
 def create_job_details_content(row_data: Dict[str, Any]) -> List[html.Div]:
     print("\n=== Creating Job Details Content ===")
-    # Get fresh data from the DataFrame
-    df = load_job_data()
     job_id = row_data["Job Id"]
-    job_data = df[df["Job Id"] == job_id].iloc[0]
+    get_job_data()
+    try:
+        job_data = _job_details_data(job_id, _JOBS_MTIME_NS, True)
+    except Exception as e:
+        # The failure isn't cached, so the next open reads the details again
+        print(f"Error loading job details: {e}")
+        job_data = _job_details_data(job_id, _JOBS_MTIME_NS, False)
     
     # Debug print
     # print("Job data columns:", job_data.index.tolist())
@@ -459,7 +791,7 @@ def create_job_details_content(row_data: Dict[str, Any]) -> List[html.Div]:
                     section_content.append(
                         html.Div([
                             dcc.Markdown(
-                                children=replace_heading_with_strong(job_data[field]),
+                                children=job_data[field],
                                 className="job-description",
                                 dangerously_allow_html=True
                             )
@@ -576,9 +908,9 @@ def assess_resume_against_requirements(resume_text: str, job_requirements: dict)
     ########################################################################################
     # This is a template that will be enhanced with actual XAI implementation
 
-    # Initialize ChatXAI
-    chat_xai = ChatXAI(api_key=os.environ.get("XAI_API_KEY"), model="grok-3-mini-beta", temperature=0, max_tokens=4096)
-    print("ChatXAI initialized with grok-3-mini-beta model")
+    # Reuse the shared ChatXAI client
+    chat_xai = get_chat_xai("grok-3-mini-beta", 0, 4096)
+    print("Using ChatXAI client with grok-3-mini-beta model")
     
     system_prompt = "You are an expert in IT recruitment and resume evaluation, with deep knowledge of IT roles, skills, and qualifications. Your role is to objectively and accurately assess resumes against job descriptions, following provided instructions precisely. Use a professional, concise, and neutral tone, ensuring all outputs are structured as specified, typically in JSON format. Base your assessments solely on the provided job description JSON and resume text, without making external assumptions or adding unverified information. Handle errors gracefully, returning clear JSON error messages for invalid or missing inputs. Maintain consistency with standard IT recruitment practices, focusing on relevancy, technical accuracy, and alignment with job requirements."
     human_prompt = f"""
@@ -724,15 +1056,14 @@ def assess_resume_against_requirements(resume_text: str, job_requirements: dict)
     [Input("job-grid", "cellRendererData"),
      Input("close-modal", "n_clicks")],
     [State("job-details-modal", "is_open")],
+    prevent_initial_call=True
 )
 def toggle_modal(cell_data: Optional[Dict[str, Any]], n_clicks: int, is_open: bool) -> tuple[bool, List[html.Div]]:
     print("\n=== Toggling Modal ===")
-    ctx = dash.callback_context
-    if not ctx.triggered:
+    trigger_id = dash.ctx.triggered_id
+    if trigger_id is None:
         return is_open, []
     
-    trigger_id = ctx.triggered[0]['prop_id'].split('.')[0]
-    
     # Handle modal close
     if trigger_id == "close-modal":
         return False, []
@@ -765,8 +1096,7 @@ def update_resume_assessment(resume_data, is_modal_open, cell_data):
         if not job_id:
             return dash.no_update, None
         
-        df = load_job_data()
-        job_data = df[df["Job Id"] == job_id].iloc[0]
+        job_data = get_job_row(job_id)
         
         if "Extracted Details" not in job_data:
             return dash.no_update, None
@@ -913,7 +1243,8 @@ layout = dbc.Container([
                     color="secondary",
                     className="ms-2"
                 ),
-            ], className="mb-4")
+            ], className="mb-4"),
+            html.Div(id="semantic-search-alert")
         ], width=12)
     ]),
     dbc.Row([
@@ -980,8 +1311,16 @@ layout = dbc.Container([
     create_assessment_modal()
 ], fluid=True)
 
+# Expand split-orient rows into AG Grid records in the browser
+clientside_callback(
+    ClientsideFunction(namespace='jobs', function_name='expand_grid_rows'),
+    Output("job-grid", "rowData"),
+    Input("job-grid-rows", "data")
+)
+
 @callback(
-    [Output("job-grid-container", "children", allow_duplicate=True)],
+    [Output("job-grid-rows", "data", allow_duplicate=True),
+     Output("job-grid-result", "data", allow_duplicate=True)],
     [Input("refresh-button", "n_clicks")],
     prevent_initial_call=True
 )
@@ -990,11 +1329,12 @@ def refresh_grid(n_clicks):
     if not n_clicks:
         return dash.no_update
     
-    # Load fresh data and create new grid
-    return [create_job_grid()]
+    # Picks up new data if the parquet file changed since it was last read
+    return list(get_grid_data())
 
 @callback(
-    [Output("job-grid-container", "children", allow_duplicate=True),
+    [Output("job-grid-rows", "data", allow_duplicate=True),
+     Output("job-grid-result", "data", allow_duplicate=True),
      Output("search-input", "value")],
     [Input("search-button", "n_clicks"),
      Input("search-input", "n_submit"),
@@ -1004,31 +1344,35 @@ def refresh_grid(n_clicks):
 )
 def update_grid(n_clicks, n_submit, clear_clicks, search_query):
     print("\n=== Updating Grid ===")
-    ctx = dash.callback_context
-    if not ctx.triggered:
+    trigger_id = dash.ctx.triggered_id
+    if trigger_id is None:
         print("No trigger detected")
-        return create_job_grid(), dash.no_update
+        return *get_grid_data(), dash.no_update
     
-    trigger_id = ctx.triggered[0]['prop_id'].split('.')[0]
     print(f"Triggered by: {trigger_id}")
     
     if trigger_id == "clear-button":
         print("Clearing grid")
-        return create_job_grid(), ""
+        return *get_grid_data(), ""
     
     if not search_query:
         print("No search query provided")
-        return create_job_grid(), dash.no_update
+        return *get_grid_data(), dash.no_update
+    
+    if len(search_query.strip()) < MIN_SEARCH_CHARS:
+        # Too short to describe a search; skip the LLM call and keep the current grid
+        print("Search query too short")
+        return dash.no_update, dash.no_update, dash.no_update
     
     print(f"Processing search query: {search_query}")
     filters = extract_filters(search_query)
     print(f"Extracted filters: {filters}")
     
-    df = load_job_data()
+    df = get_job_data()
     filtered_df = filter_dataframe(df, filters)
     print(f"Filtered results: {len(filtered_df)} rows")
     
-    return create_job_grid(filtered_df), dash.no_update
+    return *get_grid_data(filtered_df), dash.no_update
 
 @callback(
     Output("upload-resume", "children"),
@@ -1039,8 +1383,7 @@ def update_grid(n_clicks, n_submit, clear_clicks, search_query):
 )
 def update_resume_status(resume_data, contents, filename):
     print("\n=== Updating Resume Status ===")
-    ctx = dash.callback_context
-    trigger_id = ctx.triggered[0]['prop_id'].split('.')[0] if ctx.triggered else None
+    trigger_id = dash.ctx.triggered_id
     
     # If triggered by resume-store (page load or resume data change)
     if trigger_id == 'resume-store':
@@ -1127,25 +1470,21 @@ def store_resume_data(contents, filename):
         print(f"Error processing resume: {str(e)}")
         return dash.no_update, dash.no_update, None
 
-@callback(
+# Toggles run in the browser; they need no server round trip
+clientside_callback(
+    ClientsideFunction(namespace='jobs', function_name='toggle_collapse'),
     Output("collapse-resume", "is_open"),
     [Input("collapse-resume-button", "n_clicks")],
     [State("collapse-resume", "is_open")],
+    prevent_initial_call=True
 )
-def toggle_resume_collapse(n, is_open):
-    print("\n=== Toggling Resume Collapse ===")
-    if n:
-        return not is_open
-    return is_open
 
-@callback(
+# The resume itself stays in the browser instead of being uploaded to decide this
+clientside_callback(
+    ClientsideFunction(namespace='jobs', function_name='toggle_assess_button'),
     Output("assess-resume-button", "disabled"),
     Input("resume-store", "data")
 )
-def toggle_assess_button(resume_data):
-    print("\n=== Toggling Assess Button ===")
-    print(f"Resume data present: {bool(resume_data)}")
-    return not bool(resume_data)
 
 def apply_grid_filters(df: pd.DataFrame, filter_model: dict) -> pd.DataFrame:
     print("\n=== Applying Grid Filters ===")
@@ -1162,7 +1501,8 @@ def apply_grid_filters(df: pd.DataFrame, filter_model: dict) -> pd.DataFrame:
     if not filter_model:
         return df
         
-    filtered_df = df.copy()
+    # Each filter selects into a new frame, so the shared cached frame is never modified
+    filtered_df = df
     
     for column, filter_data in filter_model.items():
         if column not in filtered_df.columns:
@@ -1176,13 +1516,22 @@ def apply_grid_filters(df: pd.DataFrame, filter_model: dict) -> pd.DataFrame:
             filter_operator = filter_data.get('type', 'contains')
             
             if filter_operator == 'contains':
-                filtered_df = filtered_df[filtered_df[column].astype(str).str.contains(filter_value, case=False, na=False)]
-            elif filter_operator == 'equals':
-                filtered_df = filtered_df[filtered_df[column].astype(str) == filter_value]
-            elif filter_operator == 'startsWith':
-                filtered_df = filtered_df[filtered_df[column].astype(str).str.startswith(filter_value, na=False)]
-            elif filter_operator == 'endsWith':
-                filtered_df = filtered_df[filtered_df[column].astype(str).str.endswith(filter_value, na=False)]
+                values = filtered_df[column]
+                # Categorical columns are matched on their categories only
+                if not isinstance(values.dtype, pd.CategoricalDtype):
+                    values = values.astype(str)
+                matches = contains_any(prepare_search_values(values), [filter_value])
+                filtered_df = filtered_df[matches & filtered_df[column].notna().to_numpy()]
+            else:
+                # Missing values stay missing instead of becoming the text 'nan'
+                values = filtered_df[column]
+                values = values.astype(str).where(values.notna())
+                if filter_operator == 'equals':
+                    filtered_df = filtered_df[values == filter_value]
+                elif filter_operator == 'startsWith':
+                    filtered_df = filtered_df[values.str.startswith(filter_value, na=False)]
+                elif filter_operator == 'endsWith':
+                    filtered_df = filtered_df[values.str.endswith(filter_value, na=False)]
         
         elif filter_type == 'number':
             # Number filter
@@ -1208,12 +1557,13 @@ def apply_grid_filters(df: pd.DataFrame, filter_model: dict) -> pd.DataFrame:
             
             if filter_value:
                 date_value = pd.to_datetime(filter_value)
+                column_dates = pd.to_datetime(filtered_df[column])
                 if filter_operator == 'equals':
-                    filtered_df = filtered_df[pd.to_datetime(filtered_df[column]) == date_value]
+                    filtered_df = filtered_df[column_dates == date_value]
                 elif filter_operator == 'greaterThan':
-                    filtered_df = filtered_df[pd.to_datetime(filtered_df[column]) > date_value]
+                    filtered_df = filtered_df[column_dates > date_value]
                 elif filter_operator == 'lessThan':
-                    filtered_df = filtered_df[pd.to_datetime(filtered_df[column]) < date_value]
+                    filtered_df = filtered_df[column_dates < date_value]
     
     return filtered_df
 
@@ -1223,19 +1573,18 @@ def apply_grid_filters(df: pd.DataFrame, filter_model: dict) -> pd.DataFrame:
     [Input("assess-resume-button", "n_clicks"),
      Input("close-assessment-modal", "n_clicks")],
     [State("assessment-modal", "is_open"),
-     State("job-grid", "rowData"),
+     State("job-grid-result", "data"),
      State("job-grid", "filterModel"),
      State("search-input", "value")],
     prevent_initial_call=True
 )
-def toggle_assessment_modal(n_clicks, close_clicks, is_open, grid_data, filter_model, search_query):
+def toggle_assessment_modal(n_clicks, close_clicks, is_open, grid_result, filter_model, search_query):
     print("\n=== Toggling Assessment Modal ===")
-    ctx = dash.callback_context
-    if not ctx.triggered:
+    trigger_id = dash.ctx.triggered_id
+    if trigger_id is None:
         print("No trigger detected")
         return is_open, []
     
-    trigger_id = ctx.triggered[0]['prop_id'].split('.')[0]
     print(f"Triggered by: {trigger_id}")
     
     if trigger_id == "close-assessment-modal":
@@ -1247,11 +1596,14 @@ def toggle_assessment_modal(n_clicks, close_clicks, is_open, grid_data, filter_m
         print(f"Filter model: {filter_model}")
         
         # Get filtered data
-        df = load_job_data()
+        df = get_job_data()
 
         if search_query:
-            # filter df based on the the job ids in grid data
-            df = df[df['Job Id'].isin([data['Job Id'] for data in grid_data])]
+            # filter df based on the the job ids in the grid
+            job_ids = get_grid_job_ids(grid_result)
+            if job_ids is None:
+                return True, dbc.Alert(SEARCH_EXPIRED_MESSAGE, color="warning", className="text-center")
+            df = df[df['Job Id'].isin(job_ids)]
         
         # Apply grid filters
         if filter_model:
@@ -1263,6 +1615,7 @@ def toggle_assessment_modal(n_clicks, close_clicks, is_open, grid_data, filter_m
         # Create a list of job IDs with their titles
         job_list = []
         for i, (_, row) in enumerate(df.iterrows()):
+            row = row.where(row.notna(), None)
             job_id = row['Job Id']
             job_list.append(
                 dbc.Card([
@@ -1349,29 +1702,21 @@ def toggle_assessment_modal(n_clicks, close_clicks, is_open, grid_data, filter_m
     return is_open, []
 
 # Add callback for collapsible sections
-@callback(
+clientside_callback(
+    ClientsideFunction(namespace='jobs', function_name='toggle_collapse'),
     Output({"type": "job-collapse", "index": MATCH}, "is_open"),
     Input({"type": "job-collapse-button", "index": MATCH}, "n_clicks"),
     State({"type": "job-collapse", "index": MATCH}, "is_open"),
     prevent_initial_call=True
 )
-def toggle_job_collapse(n_clicks, is_open):
-    print("\n=== Toggling Job Collapse ===")
-    if n_clicks:
-        return not is_open
-    return is_open
 
-@callback(
+clientside_callback(
+    ClientsideFunction(namespace='jobs', function_name='toggle_collapse'),
     Output({"type": "details-collapse", "index": MATCH}, "is_open"),
     Input({"type": "view-details-button", "index": MATCH}, "n_clicks"),
     State({"type": "details-collapse", "index": MATCH}, "is_open"),
     prevent_initial_call=True
 )
-def toggle_details_collapse(n_clicks, is_open):
-    print("\n=== Toggling Details Collapse ===")
-    if n_clicks:
-        return not is_open
-    return is_open
 
 def create_assessment_display(assessment, job_id):
     print("\n=== Creating Assessment Display ===")
@@ -1484,10 +1829,10 @@ def create_assessment_display(assessment, job_id):
     [State("resume-store", "data"),
      State("job-grid", "filterModel"),
      State("search-input", "value"),
-     State("job-grid", "rowData")],
+     State("job-grid-result", "data")],
     prevent_initial_call=True
 )
-def assess_all_jobs(n_clicks, resume_data, filter_model, search_query, grid_data):
+def assess_all_jobs(n_clicks, resume_data, filter_model, search_query, grid_result):
     print("\n=== Assessing All Jobs ===")
     if not n_clicks or not resume_data:
         print("No clicks or no resume data")
@@ -1505,11 +1850,18 @@ def assess_all_jobs(n_clicks, resume_data, filter_model, search_query, grid_data
         resume_text = decoded.decode('utf-8')
         
         # Get filtered jobs data
-        df = load_job_data()
+        df = get_job_data()
 
         if search_query:
-            # filter df based on the the job ids in grid data
-            df = df[df['Job Id'].isin([data['Job Id'] for data in grid_data])]
+            # filter df based on the the job ids in the grid
+            job_ids = get_grid_job_ids(grid_result)
+            if job_ids is None:
+                return {
+                    "status": "error",
+                    "message": SEARCH_EXPIRED_MESSAGE,
+                    "timestamp": time.time()
+                }, False
+            df = df[df['Job Id'].isin(job_ids)]
 
         # Apply grid filters
         if filter_model:
@@ -1595,40 +1947,51 @@ def display_job_assessment(all_results, element_id):
     return create_assessment_display(assessment, job_id)
 
 @callback(
-    [Output("job-grid-container", "children", allow_duplicate=True),
-     Output("semantic-search-input", "value")],
+    [Output("job-grid-rows", "data", allow_duplicate=True),
+     Output("job-grid-result", "data", allow_duplicate=True),
+     Output("semantic-search-input", "value"),
+     Output("semantic-search-alert", "children")],
     [Input("semantic-search-button", "n_clicks"),
      Input("semantic-search-input", "n_submit"),
      Input("clear-semantic-button", "n_clicks")],
     [State("semantic-search-input", "value"),
-     State("job-grid", "rowData")],
+     State("job-grid-result", "data")],
     prevent_initial_call=True
 )
-def update_grid_semantic(n_clicks, n_submit, clear_clicks, search_query, grid_data):
+def update_grid_semantic(n_clicks, n_submit, clear_clicks, search_query, grid_result):
     print("\n=== Updating Grid with Semantic Search ===")
-    ctx = dash.callback_context
-    if not ctx.triggered:
+    trigger_id = dash.ctx.triggered_id
+    if trigger_id is None:
         print("No trigger detected")
-        return create_job_grid(), dash.no_update
+        return *get_grid_data(), dash.no_update, None
     
-    trigger_id = ctx.triggered[0]['prop_id'].split('.')[0]
     print(f"Triggered by: {trigger_id}")
     
     if trigger_id == "clear-semantic-button":
         print("Clearing semantic search")
-        return create_job_grid(), ""
+        return *get_grid_data(), "", None
     
     if not search_query:
         print("No semantic search query provided")
-        return create_job_grid(), dash.no_update
+        return *get_grid_data(), dash.no_update, None
+    
+    if len(search_query.strip()) < MIN_SEARCH_CHARS:
+        # Too short to embed meaningfully; keep the current grid
+        print("Semantic search query too short")
+        return dash.no_update, dash.no_update, dash.no_update, dash.no_update
     
     print(f"Processing semantic search query: {search_query}")
     
     
     try:
         # Load and filter the data
-        df = load_job_data()
-        filtered_df = df.copy()
+        df = get_job_data()
+
+        job_ids = get_grid_job_ids(grid_result)
+        if job_ids is None:
+            return dash.no_update, dash.no_update, dash.no_update, dbc.Alert(
+                SEARCH_EXPIRED_MESSAGE, color="warning", className="text-center"
+            )
 
         # 1) Rebuild your embeddings object
         embeds = OpenAIEmbeddings()
@@ -1641,7 +2004,6 @@ def update_grid_semantic(n_clicks, n_submit, clear_clicks, search_query, grid_da
         retriever = vectorstore.as_retriever(search_type="similarity", search_kwargs={"k": 10})
 
         # invoke search with filter
-        job_ids = [data['Job Id'] for data in grid_data]
         results = retriever.invoke(search_query, filter={"job_id": {"$in": job_ids}})
 
         # dedupe by page_content
@@ -1652,12 +2014,12 @@ def update_grid_semantic(n_clicks, n_submit, clear_clicks, search_query, grid_da
         print(unique_jobs)
 
         # create a new dataframe with the unique jobs
-        filtered_df = filtered_df[filtered_df["Job Id"].isin(unique_jobs)]
+        filtered_df = df[df["Job Id"].isin(unique_jobs)]
         
         print(f"Semantic search results: {len(filtered_df)} rows")
         
-        return create_job_grid(filtered_df), dash.no_update
+        return *get_grid_data(filtered_df), dash.no_update, None
         
     except Exception as e:
         print(f"Error in semantic search: {e}")
-        return create_job_grid(), dash.no_update
\ No newline at end of file
+        return *get_grid_data(), dash.no_update, None
\ No newline at end of file
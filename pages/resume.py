@@ -1,17 +1,214 @@
 import base64
-import io
+import logging
 import json
-import re
 import os
-import datetime
+import queue
+import threading
+import time
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from hashlib import blake2b
 import dash
-import PyPDF2
-from dash import html, dcc, callback, Input, Output, State
+import fitz
+from dash import html, dcc, callback, clientside_callback, ClientsideFunction, Input, Output, State
 import dash_bootstrap_components as dbc
-from langchain_xai import ChatXAI
 
 # Import from components instead of from app
 from components import create_processing_alert
+from extensions import cache, get_chat_xai
+import pdf_extraction
+
+logger = logging.getLogger(__name__)
+
+_PDF_SUFFIX = ".pdf"
+# Data-URI headers browsers use for PDF uploads; some report PDFs as generic binary
+_PDF_CONTENT_TYPES = frozenset({
+    "data:application/pdf;base64",
+    "data:application/x-pdf;base64",
+    "data:application/octet-stream;base64"
+})
+
+# Upper bounds for a single parse so a pathological PDF cannot exhaust worker memory
+_MAX_PDF_BYTES = 25 * 1024 * 1024
+_MAX_PDF_PAGES = 200
+_MAX_TEXT_CHARS = 2_000_000
+
+# Shared style for the scrollable text previews
+_PRE_STYLE = {
+    'whiteSpace': 'pre-wrap',
+    'wordBreak': 'break-word',
+    'maxHeight': '500px',
+    'overflow': 'auto'
+}
+
+# Model used to format resumes; part of the cache key so switching models starts fresh
+_FORMAT_MODEL = "grok-3-mini-beta"
+
+# Text shorter than this isn't worth a model round trip and is shown as-is
+_MIN_FORMAT_CHARS = 200
+
+# Batching puts resumes from different users into one prompt, so it is opt-in
+_FORMAT_BATCHING = os.environ.get("RESUME_FORMAT_BATCHING", "").lower() in ("1", "true", "yes")
+
+# Output budget per resume, and the cap for a batched call, which limits a batch to four resumes
+_FORMAT_TOKENS = 4096
+_MAX_BATCH_TOKENS = 16384
+
+# Longest a format request waits for the model before the user is told to retry
+_FORMAT_TIMEOUT = 120
+_FORMAT_RETRIES = 1
+
+# Formatted resumes are saved here; the directory is created once at import
+_RESUME_DIR = os.environ.get("RESUME_DIR", "data/formatted_resumes_files")
+os.makedirs(_RESUME_DIR, exist_ok=True)
+
+def _pack_text(text):
+    """Compresses text for a dcc.Store so it costs fewer bytes on each round trip."""
+    if not text:
+        return ""
+    return base64.b64encode(zlib.compress(text.encode("utf-8"))).decode("ascii")
+
+def _unpack_text(data):
+    """Restores text stored with _pack_text."""
+    if not data:
+        return ""
+    return zlib.decompress(base64.b64decode(data)).decode("utf-8")
+
+def _text_key(text):
+    """Returns a stable 128-bit BLAKE2 digest of text, identical across processes unlike hash()."""
+    return blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+def _format_single(model, raw_text):
+    """Formats one resume with the AI model and returns the raw response text."""
+    chat_xai = get_chat_xai(model, 0, _FORMAT_TOKENS, _FORMAT_TIMEOUT, _FORMAT_RETRIES)
+    
+    prompt = (
+        "Format the following resume text into a clear, structured plain-text outline. "
+        "Don't assume or add anything by yourself. "
+        "Return resume between the following dividers: '---RESUME-START---' and '---RESUME-END---'\n\n"
+        f"{raw_text}"
+    )
+    
+    messages = [
+        ("system", "You are an assistant that formats resumes."),
+        ("human", prompt)
+    ]
+    
+    response = chat_xai.invoke(messages)
+    return response.content
+
+def _format_batch(model, raw_texts):
+    """
+    Formats several resumes with a single model call.
+    
+    Each result is returned between the usual '---RESUME-START---'/'---RESUME-END---'
+    dividers, so callers can't tell it apart from a single-resume response. Resumes
+    whose numbered dividers are missing from the response are formatted on their own.
+    """
+    chat_xai = get_chat_xai(
+        model, 0, min(_FORMAT_TOKENS * len(raw_texts), _MAX_BATCH_TOKENS), _FORMAT_TIMEOUT, _FORMAT_RETRIES
+    )
+    
+    sections = "\n\n".join(
+        f"===RESUME {i}===\n{raw_text}\n===END OF RESUME {i}==="
+        for i, raw_text in enumerate(raw_texts, 1)
+    )
+    prompt = (
+        f"Format each of the following {len(raw_texts)} resume texts into a clear, structured plain-text outline. "
+        "Don't assume or add anything by yourself, and never mix content between resumes. "
+        "Return resume N between the following dividers: '---RESUME-N-START---' and '---RESUME-N-END---', "
+        "replacing N with the resume number.\n\n"
+        f"{sections}"
+    )
+    
+    messages = [
+        ("system", "You are an assistant that formats resumes."),
+        ("human", prompt)
+    ]
+    
+    response = chat_xai.invoke(messages).content
+    
+    results = []
+    for i, raw_text in enumerate(raw_texts, 1):
+        _, start_divider, tail = response.partition(f"---RESUME-{i}-START---")
+        body, end_divider, _ = tail.partition(f"---RESUME-{i}-END---")
+        if start_divider and end_divider:
+            results.append(f"---RESUME-START---\n{body.strip()}\n---RESUME-END---")
+        else:
+            logger.warning("[FORMAT] Resume %s missing from batched response, formatting it alone", i)
+            results.append(_format_single(model, raw_text))
+    return results
+
+class _FormatBatcher:
+    """
+    Coalesces format requests that arrive within a short window into one model call.
+    
+    Callers block on their own future while a daemon thread collects up to max_batch
+    requests, waiting at most max_wait seconds after the first one. Each batch's model
+    call runs on a small worker pool and is bounded by the client's timeout.
+    """
+    
+    def __init__(self, max_batch=_MAX_BATCH_TOKENS // _FORMAT_TOKENS, max_wait=0.05):
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._queue = queue.Queue()
+        self._executor = None
+        self._lock = threading.Lock()
+    
+    def submit(self, model, raw_text):
+        """Queues one resume and waits for its formatted response."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="format")
+                threading.Thread(target=self._run, name="format-batcher", daemon=True).start()
+        future = Future()
+        self._queue.put((model, raw_text, future))
+        return future.result()
+    
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            
+            by_model = {}
+            for item in batch:
+                by_model.setdefault(item[0], []).append(item)
+            for model, items in by_model.items():
+                self._executor.submit(self._process, model, items)
+    
+    def _process(self, model, items):
+        try:
+            if len(items) == 1:
+                results = [_format_single(model, items[0][1])]
+            else:
+                logger.info("[FORMAT] Formatting %s resumes in one model call", len(items))
+                results = _format_batch(model, [raw_text for _, raw_text, _ in items])
+        except Exception as e:
+            for _, _, future in items:
+                future.set_exception(e)
+            return
+        for (_, _, future), result in zip(items, results):
+            future.set_result(result)
+
+# Only created when batching is on; otherwise each request calls the model on its own thread
+_FORMAT_BATCHER = _FormatBatcher() if _FORMAT_BATCHING else None
+
+# The model is deterministic at temperature 0, so a formatted result stays valid for a day
+@cache.memoize(timeout=86400, args_to_ignore=["raw_text"], hash_method=partial(blake2b, digest_size=16))
+def _format_cached(model, text_hash, raw_text):
+    """Formats resume text with the AI model; results are cached by model and the hash of the text."""
+    if _FORMAT_BATCHER is None:
+        return _format_single(model, raw_text)
+    return _FORMAT_BATCHER.submit(model, raw_text)
 
 # Register the page
 dash.register_page(
@@ -73,6 +270,7 @@ layout = dbc.Container([
     # Store components for data management
     dcc.Store(id="raw-text-store"),
     dcc.Store(id="formatted-text-store"),
+    dcc.Store(id="last-saved-filename"),
     
     dbc.Card([
         dbc.CardHeader([
@@ -94,8 +292,10 @@ layout = dbc.Container([
     ], className="text-center mt-3 mb-4"),
 ], fluid=True)
 
-# Import all your callbacks from the original app.py
-@callback(
+# Upload area feedback is pure UI state, so it runs in the browser
+# (see assets/dashClientsideFunctions.js)
+clientside_callback(
+    ClientsideFunction(namespace='resume', function_name='update_upload_area'),
     Output('upload-content', 'children'),
     Output('upload-pdf', 'style'),
     Output('upload-alert-container', 'children'),
@@ -103,65 +303,6 @@ layout = dbc.Container([
     State('upload-pdf', 'filename'),
     prevent_initial_call=True
 )
-def update_upload_area(contents, filename):
-    """Updates the upload area UI based on file selection and provides feedback via alerts."""
-    if contents is None:
-        print("[UPLOAD] No file selected")
-        return ['Drag and Drop or ', html.A('Select a PDF File')], {
-            'width': '100%',
-            'height': '60px',
-            'lineHeight': '60px',
-            'borderWidth': '1px',
-            'borderStyle': 'dashed',
-            'borderRadius': '5px',
-            'textAlign': 'center',
-            'margin': '10px'
-        }, None
-    
-    print(f"[UPLOAD] File selected: {filename}")
-    
-    if filename.lower().endswith('.pdf'):
-        print("[UPLOAD] Valid PDF file detected")
-        return [html.I(className="fas fa-file-pdf me-2"), f"Selected: {filename}"], {
-            'width': '100%',
-            'height': '60px',
-            'lineHeight': '60px',
-            'borderWidth': '2px',
-            'borderStyle': 'solid',
-            'borderColor': 'green',
-            'borderRadius': '5px',
-            'textAlign': 'center',
-            'margin': '10px',
-            'backgroundColor': '#f0fff0'
-        }, dbc.Alert(
-            f"PDF file '{filename}' selected successfully. Click 'Parse Resume' to extract text.",
-            className="text-center",
-            color="success",
-            dismissable=True,
-            is_open=True,
-            duration=4000
-        )
-    else:
-        print(f"[UPLOAD] Invalid file type: {filename}")
-        return [html.I(className="fas fa-exclamation-triangle me-2"), f"Selected: {filename} (Not a PDF file)"], {
-            'width': '100%',
-            'height': '60px',
-            'lineHeight': '60px',
-            'borderWidth': '2px',
-            'borderStyle': 'solid',
-            'borderColor': '#ff7b00',
-            'borderRadius': '5px',
-            'textAlign': 'center',
-            'margin': '10px',
-            'backgroundColor': '#fff9f0'
-        }, dbc.Alert(
-            f"Warning: '{filename}' is not a PDF file. Only PDF files are supported.",
-            className="text-center",
-            color="warning",
-            dismissable=True,
-            is_open=True,
-            duration=6000
-        )
 
 # Add all your other resume-related callbacks from app.py
 # Parse callback
@@ -177,7 +318,7 @@ def update_upload_area(contents, filename):
 def update_output(n_clicks, content, filename):
     """Processes the uploaded PDF file to extract text content with feedback."""
     if content is None:
-        print("[PARSE] No file content available")
+        logger.warning("[PARSE] No file content available")
         return html.P("Please upload a PDF file before parsing.", className="text-center"), "", dbc.Alert(
             "No file selected. Please upload a PDF first.",
             className="text-center",
@@ -187,8 +328,8 @@ def update_output(n_clicks, content, filename):
             duration=4000
         )
 
-    if not filename.lower().endswith('.pdf'):
-        print(f"[PARSE] File {filename} is not a PDF")
+    if not filename.lower().endswith(_PDF_SUFFIX):
+        logger.warning("[PARSE] File %s is not a PDF", filename)
         return html.P("Please upload a PDF file.", className="text-center"), "", dbc.Alert(
             f"'{filename}' is not a PDF file. Please select a valid PDF.",
             className="text-center",
@@ -198,35 +339,76 @@ def update_output(n_clicks, content, filename):
             duration=4000
         )
     
-    print(f"[PARSE] Processing file: {filename}")
+    logger.info("[PARSE] Processing file: %s", filename)
     
     try:
-        content_type, content_string = content.split(',')
+        content_type, _, content_string = content.partition(',')
+        if content_type not in _PDF_CONTENT_TYPES:
+            logger.warning("[PARSE] Unexpected content type: %s", content_type)
+            return html.P("Please upload a PDF file.", className="text-center"), "", dbc.Alert(
+                f"'{filename}' does not look like a PDF file. Please select a valid PDF.",
+                className="text-center",
+                color="warning",
+                dismissable=True,
+                is_open=True,
+                duration=4000
+            )
+        
+        # Every 4 base64 characters carry 3 bytes, so oversize uploads are rejected before decoding
+        estimated_size = len(content_string) * 3 // 4
+        if estimated_size > _MAX_PDF_BYTES:
+            logger.warning("[PARSE] File too large: about %s bytes", estimated_size)
+            return html.P("Please upload a smaller PDF file.", className="text-center"), "", dbc.Alert(
+                f"'{filename}' is larger than {_MAX_PDF_BYTES // (1024 * 1024)} MB. Please upload a smaller PDF.",
+                className="text-center",
+                color="danger",
+                dismissable=True,
+                is_open=True,
+                duration=6000
+            )
+        
         decoded = base64.b64decode(content_string)
-        print(f"[PARSE] Decoded {len(decoded)} bytes of data")
+        logger.debug("[PARSE] Decoded %s bytes of data", len(decoded))
         
-        pdf_file = io.BytesIO(decoded)
-        reader = PyPDF2.PdfReader(pdf_file)
-        page_count = len(reader.pages)
-        print(f"[PARSE] PDF has {page_count} pages")
+        chunks = []
+        extracted_chars = 0
+        with fitz.open(stream=decoded, filetype="pdf") as doc:
+            page_count = doc.page_count
+            logger.debug("[PARSE] PDF has %s pages", page_count)
+            for page_text in pdf_extraction.iter_page_texts(doc, min(page_count, _MAX_PDF_PAGES)):
+                chunks.append(page_text)
+                extracted_chars += len(page_text)
+                if extracted_chars > _MAX_TEXT_CHARS:
+                    break
         
-        text = ""
-        for page_num in range(page_count):
-            page = reader.pages[page_num]
-            page_text = page.extract_text()
-            text += page_text + "\n\n"
+        truncated = page_count > _MAX_PDF_PAGES or extracted_chars > _MAX_TEXT_CHARS
+        text = "\n\n".join(chunks)
         
-        text = re.sub(r'\s+', ' ', text).strip()
-        print(f"[PARSE] Extracted {len(text)} characters")
+        # str.isprintable() is False for every whitespace character except a plain
+        # space, so clean single-line text can skip the split/join pass entirely
+        if "  " in text or not text.isprintable():
+            text = " ".join(text.split())
+        else:
+            text = text.strip()
+        text = text[:_MAX_TEXT_CHARS]
+        logger.info("[PARSE] Extracted %s characters", len(text))
 
         if text:
+            if truncated:
+                logger.warning("[PARSE] Extraction stopped at the page or character limit")
+                message = (
+                    f"Extracted {len(text)} characters, but the PDF exceeds the {_MAX_PDF_PAGES} page or "
+                    f"{_MAX_TEXT_CHARS} character limit, so only the beginning was read."
+                )
+            else:
+                message = f"Successfully extracted {len(text)} characters from {page_count} page{'s' if page_count != 1 else ''}."
             success_alert = dbc.Alert(
                 [
                     html.I(className="fas fa-check-circle me-2"),
-                    f"Successfully extracted {len(text)} characters from {page_count} page{'s' if page_count != 1 else ''}."
+                    message
                 ],
                 className="text-center",
-                color="success",
+                color="warning" if truncated else "success",
                 dismissable=True,
                 is_open=True,
                 duration=4000
@@ -235,15 +417,10 @@ def update_output(n_clicks, content, filename):
             return html.Div([
                 html.H5(f"Filename: {filename}"),
                 html.Hr(),
-                html.Pre(text, style={
-                    'whiteSpace': 'pre-wrap',
-                    'wordBreak': 'break-word',
-                    'maxHeight': '500px',
-                    'overflow': 'auto'
-                })
-            ]), text, success_alert
+                html.Pre(text, style=_PRE_STYLE)
+            ]), _pack_text(text), success_alert
         else:
-            print("[PARSE] No text extracted from PDF")
+            logger.warning("[PARSE] No text extracted from PDF")
             return html.P("No text could be extracted from this PDF. It may be scanned or contain only images."), "", dbc.Alert(
                 "This PDF doesn't contain extractable text. It may be a scanned document or image-based PDF.",
                 color="warning",
@@ -253,9 +430,7 @@ def update_output(n_clicks, content, filename):
             )
     
     except Exception as e:
-        print(f"[PARSE] Error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("[PARSE] Error: %s", e)
         return html.Div([
             html.H5("Error processing the file"),
             html.P(str(e))
@@ -291,14 +466,15 @@ def show_format_processing_alert(n_clicks, raw_text):
     Output('format-alert-container', 'children', allow_duplicate=True),
     Input('format-button', 'n_clicks'),
     State('raw-text-store', 'data'),
+    running=[(Output('format-button', 'disabled'), True, False)],
     prevent_initial_call=True
 )
 def format_text(n_clicks, raw_text):
     """Formats resume text using the ChatXAI API with detailed status feedback."""
-    print("[FORMAT] Formatting request received")
+    logger.info("[FORMAT] Formatting request received")
     
     if not raw_text:
-        print("[FORMAT] No raw text available")
+        logger.warning("[FORMAT] No raw text available")
         return html.P("No text available to format. Please parse a resume first.", className="text-center"), "", dbc.Alert(
             "No text to format. Please upload and parse a resume first.",
             className="text-center",
@@ -309,14 +485,31 @@ def format_text(n_clicks, raw_text):
         )
     
     try:
-        print(f"[FORMAT] Processing {len(raw_text)} characters")
+        raw_text = _unpack_text(raw_text)
+        logger.debug("[FORMAT] Processing %s characters", len(raw_text))
+        
+        if len(raw_text) < _MIN_FORMAT_CHARS or "---RESUME-START---" in raw_text:
+            logger.info("[FORMAT] Text is short or already formatted, skipping the AI model")
+            return html.Div([
+                html.Pre(raw_text, style=_PRE_STYLE)
+            ]), _pack_text(raw_text), dbc.Alert(
+                [
+                    html.I(className="fas fa-info-circle me-2"),
+                    "The text is already short or formatted, so it was kept as-is."
+                ],
+                className="text-center",
+                color="info",
+                dismissable=True,
+                is_open=True,
+                duration=5000
+            )
         
         # Show processing message at the beginning
         processing_message = f"Processing {len(raw_text)} characters with Grok-3-mini model..."
         
         api_key = os.environ.get("XAI_API_KEY")
         if not api_key:
-            print("[FORMAT] API key missing")
+            logger.error("[FORMAT] API key missing")
             return html.Div([
                 html.H5("API Key Missing"),
                 html.P("Please set the XAI_API_KEY environment variable.")
@@ -332,48 +525,29 @@ def format_text(n_clicks, raw_text):
                 duration=0  # No auto-dismiss for this critical error
             )
         
-        chat_xai = ChatXAI(api_key=api_key, model="grok-3-mini-beta", temperature=0, max_tokens=4096)
-        
-        start_time = datetime.datetime.now()
+        t0 = time.perf_counter()
         
         # Don't create an unused processing alert here
-        print("[FORMAT] Started processing with AI model")
-        
-        prompt = (
-            "Format the following resume text into a clear, structured plain-text outline. "
-            "Don't assume or add anything by yourself. "
-            "Return resume between the following dividers: '---RESUME-START---' and '---RESUME-END---'\n\n"
-            f"{raw_text}"
-        )
-        
-        messages = [
-            ("system", "You are an assistant that formats resumes."),
-            ("human", prompt)
-        ]
-        
-        response = chat_xai.invoke(messages)
+        logger.debug("[FORMAT] Started processing with AI model")
         
-        end_time = datetime.datetime.now()
-        duration = (end_time - start_time).total_seconds()
-        print(f"[FORMAT] Processing completed in {duration:.2f} seconds")
+        text_hash = _text_key(raw_text)
+        formatted_text = _format_cached(_FORMAT_MODEL, text_hash, raw_text)
         
-        formatted_text = response.content
+        duration = time.perf_counter() - t0
+        logger.info("[FORMAT] Processing completed in %.2f seconds", duration)
         
-        if "---RESUME-START---" in formatted_text and "---RESUME-END---" in formatted_text:
-            formatted_text = formatted_text.split("---RESUME-START---")[1].split("---RESUME-END---")[0].strip()
-            print(f"[FORMAT] Extracted {len(formatted_text)} characters of formatted text")
+        _, start_divider, tail = formatted_text.partition("---RESUME-START---")
+        body, end_divider, _ = tail.partition("---RESUME-END---")
+        if start_divider and end_divider:
+            formatted_text = body.strip()
+            logger.debug("[FORMAT] Extracted %s characters of formatted text", len(formatted_text))
         else:
-            print("[FORMAT] Warning: Response dividers not found")
+            logger.warning("[FORMAT] Response dividers not found")
         
         return html.Div([
-            html.Pre(formatted_text, style={
-                'whiteSpace': 'pre-wrap',
-                'wordBreak': 'break-word',
-                'maxHeight': '500px',
-                'overflow': 'auto'
-            }),
+            html.Pre(formatted_text, style=_PRE_STYLE),
             html.Div(f"Processing time: {duration:.2f} seconds", className="text-muted mt-2 text-end small")
-        ]), formatted_text, dbc.Alert(
+        ]), _pack_text(formatted_text), dbc.Alert(
             [
                 html.I(className="fas fa-check-circle me-2"),
                 f"Resume formatted successfully in {duration:.2f} seconds using Grok-3-mini model."
@@ -386,9 +560,7 @@ def format_text(n_clicks, raw_text):
         )
     
     except Exception as e:
-        print(f"[FORMAT] Error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("[FORMAT] Error: %s", e)
         return html.Div([
             html.H5("Error formatting the text"),
             html.P(str(e))
@@ -407,16 +579,17 @@ def format_text(n_clicks, raw_text):
 # Save resume callback
 @callback(
     Output("save-alert-container", "children"),
+    Output("last-saved-filename", "data"),
     Input("save-button", "n_clicks"),
     State("formatted-text-store", "data"),
     prevent_initial_call=True
 )
 def save_resume(n_clicks, formatted_text):
     """Saves the formatted resume text to a local file."""
-    print("[SAVE] Save request received")
+    logger.info("[SAVE] Save request received")
     
     if not formatted_text:
-        print("[SAVE] No formatted text available")
+        logger.warning("[SAVE] No formatted text available")
         return dbc.Alert(
             "No text available to save. Please parse and format a resume first.",
             className="text-center",
@@ -424,18 +597,20 @@ def save_resume(n_clicks, formatted_text):
             dismissable=True,
             is_open=True,
             duration=3000
-        )
+        ), dash.no_update
     
     try:
-        os.makedirs("data/formatted_resumes_files", exist_ok=True)
-        
-        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"data/formatted_resumes_files/resume_{timestamp}.txt"
+        formatted_text = _unpack_text(formatted_text)
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        basename = f"resume_{timestamp}.txt"
+        filename = os.path.join(_RESUME_DIR, basename)
         
         with open(filename, "w", encoding="utf-8") as f:
             f.write(formatted_text)
         
-        print(f"[SAVE] Saved to {filename}")
+        logger.info("[SAVE] Saved to %s", filename)
+        # Remember which text the name belongs to so Download only reuses it for the same content
+        last_saved = {"filename": basename, "key": _text_key(formatted_text)}
         return dbc.Alert(
             "Resume saved successfully!",
             className="text-center",
@@ -443,11 +618,9 @@ def save_resume(n_clicks, formatted_text):
             dismissable=True,
             is_open=True,
             duration=3000
-        )
+        ), last_saved
     except Exception as e:
-        print(f"[SAVE] Error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("[SAVE] Error: %s", e)
         return dbc.Alert(
             f"Error saving file: {str(e)}",
             className="text-center",
@@ -455,7 +628,7 @@ def save_resume(n_clicks, formatted_text):
             dismissable=True,
             is_open=True,
             duration=3000
-        )
+        ), dash.no_update
 
 # Download resume callback
 @callback(
@@ -463,14 +636,15 @@ def save_resume(n_clicks, formatted_text):
     Output("download-text", "data"),
     Input("download-button", "n_clicks"),
     State("formatted-text-store", "data"),
+    State("last-saved-filename", "data"),
     prevent_initial_call=True
 )
-def download_resume(n_clicks, formatted_text):
+def download_resume(n_clicks, formatted_text, last_saved):
     """Prepares formatted resume text for client-side download with enhanced feedback."""
-    print("[DOWNLOAD] Download request received")
+    logger.info("[DOWNLOAD] Download request received")
     
     if not formatted_text:
-        print("[DOWNLOAD] No formatted text available")
+        logger.warning("[DOWNLOAD] No formatted text available")
         return dbc.Alert(
             [
                 html.I(className="fas fa-exclamation-triangle me-2"),
@@ -483,9 +657,13 @@ def download_resume(n_clicks, formatted_text):
             duration=3000
         ), dash.no_update
     
-    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"resume_{timestamp}.txt"
-    print(f"[DOWNLOAD] Preparing file '{filename}' with {len(formatted_text)} characters")
+    formatted_text = _unpack_text(formatted_text)
+    if last_saved and last_saved.get("key") == _text_key(formatted_text):
+        filename = last_saved["filename"]
+    else:
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        filename = f"resume_{timestamp}.txt"
+    logger.info("[DOWNLOAD] Preparing file '%s' with %s characters", filename, len(formatted_text))
     
     return dbc.Alert(
         [
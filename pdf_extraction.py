@@ -0,0 +1,28 @@
+"""
+PDF text extraction helpers for the Seeklyzer application.
+Pages are extracted in-process; resumes are capped at a few hundred pages, so
+worker processes would cost more to start and feed than they save.
+"""
+
+from typing import Iterator
+
+import fitz
+
+# Plain "text" mode only walks text spans; drawings, shadings and images are never
+# decoded. The flags are the mode's defaults minus image handling, spelled out so a
+# later change can't quietly switch to the heavier "dict"/"rawdict" extraction.
+TEXT_FLAGS = fitz.TEXT_PRESERVE_LIGATURES | fitz.TEXT_PRESERVE_WHITESPACE | fitz.TEXT_MEDIABOX_CLIP
+
+def iter_page_texts(doc: fitz.Document, page_count: int) -> Iterator[str]:
+    """
+    Extracts the first page_count pages of a PDF.
+
+    Args:
+        doc (fitz.Document): The open document
+        page_count (int): Number of pages to read from the start of the document
+
+    Yields:
+        str: The text of each page, in page order
+    """
+    for page in doc.pages(0, page_count):
+        yield page.get_text("text", flags=TEXT_FLAGS)
@@ -212,7 +212,8 @@ def process_job_descriptions():
     
     # Save the updated dataframe to new files
     print(f"Saving results to {output_file}...")
-    df.to_parquet(output_file, index=False)
+    # Small row groups let the app read a single job's details without decoding the whole file
+    df.to_parquet(output_file, index=False, compression='zstd', compression_level=3, row_group_size=1000)
     
     excel_output = output_file.replace('.parquet', '.xlsx')
     print(f"Saving Excel version to {excel_output}...")
@@ -299,7 +299,7 @@ def save_outputs(df):
     print(f"[OK] Excel file saved: {file_name}.xlsx")
     df.to_feather(f'{file_name}.feather')
     print(f"[OK] Feather file saved: {file_name}.feather")
-    df.to_parquet(f'{file_name}.parquet', index=False)
+    df.to_parquet(f'{file_name}.parquet', index=False, compression='zstd', compression_level=3)
     print(f"[OK] Parquet file saved: {file_name}.parquet") 
     df.to_json(f'{file_name}.json', orient='records', lines=True)
     print(f"[OK] JSON file saved: {file_name}.json")